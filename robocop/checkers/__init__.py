@@ -19,7 +19,8 @@ Checkers are categorized into following groups:
 
 Checker has two basic types:
 
-- ``VisitorChecker`` uses Robot Framework parsing api and Python `ast` module for traversing Robot code as nodes
+- ``VisitorChecker`` uses Robot Framework parsing api and Python `ast` module for traversing Robot code as nodes.
+  Visitor checkers that do not call ``generic_visit`` (or ``visit``) share single traversal of the file model
 
 - ``RawFileChecker`` simply reads Robot file as normal file and scans every line
 
@@ -76,6 +77,75 @@ class VisitorChecker(BaseChecker, ast.NodeVisitor):  # noqa
         self.generic_visit(node)
 
 
+class CompositeChecker(ast.NodeVisitor):
+    """
+    Run multiple visitor checkers in single traversal of the model instead of traversing it once per checker.
+
+    Only checkers that do not control the traversal themselves can be composed - their visit methods do not call
+    ``visit`` or ``generic_visit`` and ``visit_File`` is not overridden. Such checker behaves the same as with
+    ``ast.NodeVisitor``: its handler is called for matching node and children of this node are not visited by it.
+    Other checkers should scan the file separately.
+    """
+    def __init__(self, checkers):
+        self.checkers = tuple(checkers)
+        self.handlers = {}
+
+    @staticmethod
+    def can_compose(checker):
+        if not isinstance(checker, VisitorChecker):
+            return False
+        checker_class = type(checker)
+        if checker_class.scan_file is not VisitorChecker.scan_file \
+                or checker_class.visit_File is not VisitorChecker.visit_File \
+                or checker_class.visit is not ast.NodeVisitor.visit \
+                or checker_class.generic_visit is not ast.NodeVisitor.generic_visit:
+            return False
+        for cls in checker_class.__mro__[:checker_class.__mro__.index(VisitorChecker)]:
+            for method in vars(cls).values():
+                method = getattr(method, '__func__', method)
+                if inspect.isfunction(method) and _calls_visit(method.__code__):
+                    return False
+        return True
+
+    def get_handlers(self, node_class):
+        """ Return (and cache) checkers and their handlers for given node class """
+        handlers = self.handlers.get(node_class)
+        if handlers is None:
+            method = 'visit_' + node_class.__name__
+            handlers = {checker: getattr(checker, method) for checker in self.checkers if hasattr(checker, method)}
+            self.handlers[node_class] = handlers
+        return handlers
+
+    def scan_file(self, model):
+        self.visit_children(model, self.checkers)
+
+    def visit_node(self, node, active):
+        handlers = self.get_handlers(type(node))
+        if handlers:
+            remaining = []
+            for checker in active:
+                handler = handlers.get(checker)
+                if handler is None:
+                    remaining.append(checker)
+                else:
+                    handler(node)
+            if not remaining:
+                return
+            active = remaining
+        self.visit_children(node, active)
+
+    def visit_children(self, node, active):
+        for child in ast.iter_child_nodes(node):
+            self.visit_node(child, active)
+
+
+def _calls_visit(code):
+    """ Check if code object (or any nested code object like closure) uses visit or generic_visit methods """
+    if 'visit' in code.co_names or 'generic_visit' in code.co_names:
+        return True
+    return any(_calls_visit(const) for const in code.co_consts if inspect.iscode(const))
+
+
 class RawFileChecker(BaseChecker):  # noqa
     type = 'rawfile_checker'
 
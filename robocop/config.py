@@ -13,6 +13,17 @@ def translate_pattern(pattern):
     return re.compile(fnmatch.translate(pattern))
 
 
+def non_negative_int(value):
+    """ Type for --jobs argument - number of processes (0 for number of CPUs) """
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"invalid value: '{value}' (expected 0 or positive number)")
+    return number
+
+
 class ParseDelimitedArgAction(argparse.Action):  # pylint: disable=too-few-public-methods
     def __call__(self, parser, namespace, values, option_string=None):
         container = getattr(namespace, self.dest)
@@ -28,10 +39,10 @@ class ParseCheckerConfig(argparse.Action):  # pylint: disable=too-few-public-met
 
 class ParseFileTypes(argparse.Action):  # pylint: disable=too-few-public-methods
     def __call__(self, parser, namespace, values, option_string=None):
-        filetypes = getattr(namespace, self.dest)
+        filetypes = set(getattr(namespace, self.dest))
         for filetype in values.split(','):
-            filetypes.add(filetype if filetype.startswith('.') else '.' + filetype)
-        setattr(namespace, self.dest, filetypes)
+            filetypes.add(filetype.lower() if filetype.startswith('.') else '.' + filetype.lower())
+        setattr(namespace, self.dest, frozenset(filetypes))
 
 
 class SetRuleThreshold(argparse.Action):
@@ -66,11 +77,12 @@ class Config:
         self.ext_rules = set()
         self.include_patterns = []
         self.exclude_patterns = []
-        self.filetypes = {'.robot', '.resource', '.tsv'}
+        self.filetypes = frozenset({'.robot', '.resource', '.tsv'})
         self.list = ''
         self.list_configurables = ''
         self.output = None
         self.recursive = True
+        self.jobs = 1
         self.parser = self._create_parser()
 
     HELP_MSGS = {
@@ -96,6 +108,8 @@ class Config:
         'help_threshold':    f'Disable rules below given threshold. Available message levels: '
                              f'{" < ".join(sev.value for sev in RuleSeverity)}',
         'help_recursive':   'Use this flag to stop scanning directories recursively',
+        'help_jobs':        'Number of processes used to scan files in parallel. Use 0 for number of CPUs.\n'
+                            'Default: 1',
         'help_argfile':     'Path to file with arguments',
         'help_ignore':      'Ignore file(s) and path(s) provided. Glob patterns are supported',
         'help_info':        'Print this help message and exit',
@@ -167,6 +181,8 @@ class Config:
                               help=self.HELP_MSGS['help_ext_rules'])
         optional.add_argument('--no-recursive', dest='recursive', action='store_false',
                               help=self.HELP_MSGS['help_recursive'])
+        optional.add_argument('-j', '--jobs', type=non_negative_int, default=self.jobs, metavar='N',
+                              help=self.HELP_MSGS['help_jobs'])
         optional.add_argument('-r', '--reports', action=ParseDelimitedArgAction, default=self.reports,
                               help=self.HELP_MSGS['help_reports'])
         optional.add_argument('-f', '--format', type=str, default=self.format, help=self.HELP_MSGS['help_format'])
@@ -1,5 +1,14 @@
 class RobocopFatalError(ValueError):
-    pass
+    def __reduce__(self):
+        # subclasses take different arguments than the formatted message - pickle (used when scanning files
+        # in parallel processes) needs to recreate the error from the message alone
+        return _restore_error, (type(self), str(self))
+
+
+def _restore_error(error_class, msg):
+    error = error_class.__new__(error_class)
+    ValueError.__init__(error, msg)
+    return error
 
 
 class ConfigGeneralError(RobocopFatalError):
@@ -10,9 +10,9 @@ You can use separate arguments (``-r report1 -r report2``) or comma-separated li
     robocop --report rules_by_id,some_other_report path/to/file.robot
 
 """
-from collections import defaultdict
-from operator import itemgetter
+from collections import Counter
 import robocop.exceptions
+from robocop.rules import RuleSeverity
 
 
 class Report:
@@ -37,21 +37,19 @@ class RulesByIdReport(Report):
     """
     def __init__(self):
         self.name = 'rules_by_id'
-        self.message_counter = defaultdict(int)
+        self.message_counter = Counter()
 
     def add_message(self, message, **kwargs):  # noqa
         self.message_counter[message.get_fullname()] += 1
 
     def get_report(self):
-        message_counter_ordered = sorted([(message, count)
-                                          for message, count in self.message_counter.items()],
-                                         key=itemgetter(1), reverse=True)
         report = '\nIssues by IDs:\n'
-        if not message_counter_ordered:
+        if not self.message_counter:
             report += "No issues found\n"
             return report
-        longest_name = max(len(msg[0]) for msg in message_counter_ordered)
-        report += '\n'.join(f"{message:{longest_name}} : {count}" for message, count in message_counter_ordered)
+        longest_name = max(map(len, self.message_counter))
+        report += '\n'.join(f"{message:{longest_name}} : {count}"
+                             for message, count in self.message_counter.most_common())
         return report
 
 
@@ -67,17 +65,19 @@ class RulesBySeverityReport(Report):
     """
     def __init__(self):
         self.name = 'rules_by_error_type'
-        self.severity_counter = defaultdict(int)
+        # keyed by severity value - hash of str is cached while Enum member is hashed in Python code
+        self.severity_counter = {severity.value: 0 for severity in RuleSeverity}
 
     def add_message(self, message, **kwargs):  # pylint: disable=unused-argument
-        self.severity_counter[message.severity] += 1
+        self.severity_counter[message.severity.value] += 1
 
     def get_report(self):
         issues_count = sum(self.severity_counter.values())
         if not issues_count:
             return 'Found 0 issues'
         report = f'\nFound {issues_count} issue(s): '
-        report += ', '.join(f"{count} {severity.name}(s)" for severity, count in self.severity_counter.items())
+        report += ', '.join(f"{count} {RuleSeverity(severity).name}(s)"
+                            for severity, count in self.severity_counter.items() if count)
         report += '.'
         return report
 
@@ -116,7 +116,7 @@ class ReturnStatusReport(Report):
 
     def get_report(self):
         for severity, count in self.counter.severity_counter.items():
-            threshold = self.quality_gate.get(severity.value, 0)
+            threshold = self.quality_gate.get(severity, 0)
             if -1 < threshold < count:
                 self.return_status = 1
                 break
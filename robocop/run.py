@@ -2,23 +2,28 @@
 Main class of Robocop module. Gather files for scan, checkers and parse cli arguments and scan files.
 """
 import inspect
+import io
+import multiprocessing
+import os
 import sys
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
 
-from robot.api import get_model
-
 import robocop.exceptions
 from robocop import checkers
 from robocop import reports
 from robocop.config import Config
-from robocop.utils import DisablersFinder, FileType, FileTypeChecker
+from robocop.utils import compile_format, DisablersFinder, FileType, FileTypeChecker
 
 
 class Robocop:
     def __init__(self, from_cli=False):
         self.files = {}
+        self.models = {}
         self.checkers = []
+        self.composite_checker = None
         self.out = sys.stdout
+        self.lines_buffer = None
         self.rules = {}
         self.reports = []
         self.disabler = None
@@ -36,8 +41,25 @@ class Robocop:
         self.out = self.config.output or sys.stdout
 
     def write_line(self, line):
-        """ Print line using file=self.out parameter (set in `set_output` method) """
-        print(line, file=self.out)
+        """
+        Print line using file=self.out parameter (set in `set_output` method).
+        Inside `buffered_output` context line is stored and written together with other buffered lines.
+        """
+        if self.lines_buffer is not None:
+            self.lines_buffer.append(line)
+        else:
+            print(line, file=self.out)
+
+    @contextmanager
+    def buffered_output(self):
+        """ Collect lines written inside the context and write them to the output at once """
+        self.lines_buffer = []
+        try:
+            yield
+        finally:
+            lines, self.lines_buffer = self.lines_buffer, None
+            if lines:
+                self.out.write('\n'.join(lines) + '\n')
 
     def run(self):
         """ Entry point for running scans """
@@ -56,6 +78,7 @@ class Robocop:
         Files with .resource extension are `RESOURCE` type.
         If the file is imported somewhere then file type is `RESOURCE`. Otherwise file type is `GENERAL`.
         These types are important since they are used to define parsing class for robot API.
+        Models parsed here are cached and reused in the scan if file type does not change.
         """
         if not self.config.paths:
             print('No path has been provided')
@@ -69,32 +92,103 @@ class Robocop:
             else:
                 self.files[file] = FileType.GENERAL
         file_type_checker = FileTypeChecker(self.files, self.config.exec_dir)
-        for file in self.files:
+        for file, file_type in self.files.items():
             file_type_checker.source = file
-            model = get_model(file)
+            model = file_type.get_parser()(str(file))
+            self.models[file] = (file_type, model)
             file_type_checker.visit(model)
 
+    def get_model(self, file):
+        """
+        Return model of the file parsed during file type recognition. File is parsed again only if its type
+        changed since then (for example file turned out to be imported as resource).
+        """
+        file_type = self.files[file]
+        parsed_with_type, model = self.models.pop(file, (None, None))
+        if parsed_with_type is not file_type:
+            model = file_type.get_parser()(str(file))
+        return model
+
     def run_checks(self):
-        for file in self.files:
-            found_issues = []
-            self.register_disablers(file)
-            if self.disabler.file_disabled:
-                continue
-            model = self.files[file].get_parser()(str(file))
-            for checker in self.checkers:
-                if checker.disabled:
+        self.compose_checkers()
+        jobs = self.get_jobs_count()
+        if jobs == 1:
+            for file in self.files:
+                self.report_issues(self.scan_file(file))
+            return
+        files = list(self.files)
+        chunksize = max(1, len(files) // (4 * jobs))
+        sys.stdout.flush()  # forked workers flush inherited stdout buffer on exit
+        # multiprocessing.Pool instead of ProcessPoolExecutor: initializer and context were added to the latter in 3.7
+        pool = multiprocessing.get_context('fork').Pool(jobs, _init_worker, (self,))
+        try:
+            for file, (found_issues, printed) in zip(files, pool.imap(_scan_one, files, chunksize)):
+                sys.stdout.write(printed)
+                if not found_issues:
                     continue
-                checker.source = str(file)
+                self.register_disablers(file)
+                self.report_issues(found_issues)
+        except BaseException:
+            pool.terminate()  # do not wait for remaining files when scan cannot be completed
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+        self.models.clear()
+
+    def get_jobs_count(self):
+        """
+        Return number of processes used for scanning files. Small number of files is not worth starting the pool
+        and on platforms without `fork` start method (Windows) files are always scanned in the main process.
+        """
+        if self.config.jobs == 1 or len(self.files) < 4 or 'fork' not in multiprocessing.get_all_start_methods():
+            return 1
+        jobs = self.config.jobs or os.cpu_count() or 1
+        return min(jobs, len(self.files))
+
+    def scan_file(self, file):
+        """ Run all enabled checkers on given file and return found issues sorted by their position """
+        found_issues = []
+        self.register_disablers(file)
+        if self.disabler.file_disabled:
+            self.models.pop(file, None)
+            return found_issues
+        model = self.get_model(file)
+        composed = self.composite_checker.checkers if self.composite_checker is not None else ()
+        for checker in self.checkers:
+            if checker.disabled:
+                continue
+            checker.source = str(file)
+            if checker not in composed:
                 checker.scan_file(model)
-                found_issues += checker.issues
-                checker.issues.clear()
-            found_issues.sort()
-            for issue in found_issues:
-                self.report(issue)
+        if composed:
+            self.composite_checker.scan_file(model)
+        for checker in self.checkers:
+            found_issues += checker.issues
+            checker.issues.clear()
+        found_issues.sort()
+        return found_issues
+
+    def compose_checkers(self):
+        """ Group enabled checkers that can share single traversal of the model into composite checker """
+        self.composite_checker = checkers.CompositeChecker(
+            checker for checker in self.checkers
+            if not checker.disabled and checkers.CompositeChecker.can_compose(checker)
+        )
 
     def register_disablers(self, file):
         """ Parse content of file to find any disabler statements like # robocop: disable=rulename """
-        self.disabler = DisablersFinder(file, self)
+        if self.disabler is None:
+            self.disabler = DisablersFinder(file, self)
+        else:
+            self.disabler.reset(file)
+
+    def report_issues(self, found_issues):
+        """ Report issues found in single file. Output is buffered and written once per file """
+        with self.buffered_output():
+            for issue in found_issues:
+                self.report(issue)
 
     def report(self, rule_msg):
         if not rule_msg.enabled:  # disabled from cli
@@ -112,7 +206,7 @@ class Robocop:
                          msg_name=rule_msg.name)
 
     def log_message(self, **kwargs):
-        self.write_line(self.config.format.format(**kwargs))
+        self.write_line(compile_format(self.config.format)(**kwargs))
 
     def load_checkers(self):
         checkers.init(self)
@@ -121,7 +215,7 @@ class Robocop:
         if not (self.config.list or self.config.list_configurables):
             return
         rule_by_id = {msg.rule_id: msg for checker in self.checkers for msg in checker.rules_map.values()}
-        rule_ids = sorted([key for key in rule_by_id])
+        rule_ids = sorted(rule_by_id)
         for rule_id in rule_ids:
             if self.config.list:
                 if not rule_by_id[rule_id].matches_pattern(self.config.list):
@@ -154,7 +248,10 @@ class Robocop:
             if rule.rule_id in self.rules:
                 (_, checker_prev) = self.rules[rule.rule_id]
                 raise robocop.exceptions.DuplicatedRuleError('id', rule.rule_id, checker, checker_prev)
-            self.rules[rule_name] = (rule, checker)
+            # interned so lookups of message rule name and id in source code disablers can compare by identity
+            rule.name = sys.intern(rule.name)
+            rule.rule_id = sys.intern(rule.rule_id)
+            self.rules[rule.name] = (rule, checker)
             self.rules[rule.rule_id] = (rule, checker)
         self.checkers.append(checker)
 
@@ -174,30 +271,50 @@ class Robocop:
         if self.config.is_path_ignored(path):
             return
         if path.is_file():
-            if self.should_parse(path):
-                yield path.absolute()
+            if self.should_parse(path.suffix):
+                yield Path(os.path.abspath(path))
         elif path.is_dir():
-            for file in path.iterdir():
-                if file.is_dir() and not recursive:
-                    continue
-                yield from self.get_absolute_path(file, recursive)
+            yield from self.get_files_from_dir(str(path), recursive)
+
+    def get_files_from_dir(self, directory, recursive):
+        """
+        Yield absolute paths of files to be parsed from given directory. `os.scandir` entries cache file type
+        information so it does not require separate system call for every check.
+        """
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+        for entry in entries:
+            if entry.is_dir():
+                if recursive and not self.is_entry_ignored(entry):
+                    yield from self.get_files_from_dir(entry.path, recursive)
+            elif entry.is_file():
+                if self.should_parse(os.path.splitext(entry.name)[1]) and not self.is_entry_ignored(entry):
+                    yield Path(os.path.abspath(entry.path))
+            elif not os.path.exists(entry.path):  # broken symlink
+                raise robocop.exceptions.FileError(Path(entry.path))
 
-    def should_parse(self, file):
+    def is_entry_ignored(self, entry):
+        return bool(self.config.ignore) and self.config.is_path_ignored(Path(entry.path))
+
+    def should_parse(self, suffix):
         """ Check if file extension is in list of supported file types (can be configured from cli) """
-        return file.suffix and file.suffix.lower() in self.config.filetypes
+        return suffix and suffix.lower() in self.config.filetypes
 
     def any_rule_enabled(self, checker):
-        for name, rule in checker.rules_map.items():
+        any_enabled = False
+        for rule in checker.rules_map.values():
             rule.enabled = self.config.is_rule_enabled(rule)
-            checker.rules_map[name] = rule
-        return any(msg.enabled for msg in checker.rules_map.values())
+            any_enabled |= rule.enabled
+        return any_enabled
 
     def configure_checkers_or_reports(self):
+        reports_by_name = {report.name: report for report in self.reports}
         for config in self.config.configure:
-            if config.count(':') < 2:
+            parts = config.split(':')
+            if len(parts) < 3:
                 raise robocop.exceptions.ConfigGeneralError(
                     f"Provided invalid config: '{config}' (general pattern: <rule>:<param>:<value>)")
-            rule_or_report, param, value, *values = config.split(':')
+            rule_or_report, param, value, *values = parts
             if rule_or_report in self.rules:
                 msg, checker = self.rules[rule_or_report]
                 if param == 'severity':
@@ -209,15 +326,32 @@ class Robocop:
                         raise robocop.exceptions.ConfigGeneralError(
                             f"Provided param '{param}' for rule '{rule_or_report}' does not exist. {available_conf}")
                     checker.configure(configurable[1], configurable[2](value))
-            elif any(rule_or_report == report.name for report in self.reports):
-                for report in self.reports:
-                    if report.name == rule_or_report:
-                        report.configure(param, value, *values)
+            elif rule_or_report in reports_by_name:
+                reports_by_name[rule_or_report].configure(param, value, *values)
             else:
                 raise robocop.exceptions.ConfigGeneralError(
                     f"Provided rule or report '{rule_or_report}' does not exist")
 
 
+_WORKER_LINTER = None
+
+
+def _init_worker(linter):
+    """ Store linter inherited from parent process so it can be used by `_scan_one` """
+    global _WORKER_LINTER  # pylint: disable=global-statement
+    _WORKER_LINTER = linter
+
+
+def _scan_one(file):
+    """
+    Scan single file in worker process. Only file path and found issues are passed between processes.
+    Text printed during the scan is returned as well, so the parent can print it in the same order as serial scan.
+    """
+    with redirect_stdout(io.StringIO()) as printed:
+        found_issues = _WORKER_LINTER.scan_file(file)
+    return found_issues, printed.getvalue()
+
+
 def run_robocop():
     linter = Robocop(from_cli=True)
     linter.run()
@@ -3,10 +3,17 @@ Parsing utils
 """
 from robocop.utils.disablers import DisablersFinder
 from robocop.utils.file_types import FileType, FileTypeChecker
-from robocop.utils.utils import modules_from_path, modules_from_paths, modules_in_current_dir, normalize_robot_name
+from robocop.utils.utils import (
+    compile_format,
+    modules_from_path,
+    modules_from_paths,
+    modules_in_current_dir,
+    normalize_robot_name
+)
 
 
 __all__ = [
+    'compile_format',
     'DisablersFinder',
     'FileType',
     'FileTypeChecker',
@@ -1,87 +1,151 @@
 """
 Collection of classes for detecting checker disablers (like # robocop: disable) in robot files
 """
+import math
 import re
-from copy import deepcopy
+import sys
+from bisect import bisect_right
 from collections import defaultdict
 import robocop.exceptions
 
 
 class DisablersInFile:  # pylint: disable=too-few-public-methods
     """ Container for file disablers """
+    __slots__ = ('lastblock', 'lines', 'blocks')
+
     def __init__(self):
         self.lastblock = -1
         self.lines = set()
         self.blocks = []
 
-    def copy(self):
-        """ Used by defaultdict to create new instance for every new key in disablers container """
-        return deepcopy(self)
-
 
 class DisablersFinder:
     """ Parse all scanned file and find and disablers (in line or blocks) """
+    # whole file is searched at once: statement is the part of line before first `#` (empty for block disablers)
+    disabler_pattern = re.compile(
+        r'^(?P<statement>[^#\n]*)#[^\n]*?robocop: (?P<disabler>disable|enable)=?(?P<rules>[\w\-,]*)',
+        re.MULTILINE
+    )
+
     def __init__(self, source, linter):
         self.linter = linter
+        self._rules = defaultdict(DisablersInFile)
+        self.reset(source)
+
+    def reset(self, source):
+        """ Clear disablers found so far and read new file - allows to reuse the same instance for every file """
         self.file_disabled = False
-        self.any_disabler = False
-        self.disabler_pattern = re.compile(r'robocop: (?P<disabler>disable|enable)=?(?P<rules>[\w\-,]*)')
-        self.rules = defaultdict(DisablersInFile().copy)
-        self._parse_file(source)
+        self.content = ''
+        self.parsed = False
+        self._rules.clear()
+        self._disabled_lines = set()
+        self._read_file(source)
+
+    @property
+    def rules(self):
+        """ Disablers of every rule found in the file. File content is parsed on first use """
+        self._parse_disablers()
+        return self._rules
+
+    @property
+    def disabled_lines(self):
+        """
+        Lines with any rule disabled. Most of reported messages are not in this set and
+        can be accepted with single lookup instead of checking every disabled rule.
+        """
+        self._parse_disablers()
+        return self._disabled_lines
+
+    @property
+    def any_disabler(self):
+        return len(self.rules) != 0
 
     def is_rule_disabled(self, rule_msg):
         """
         Check if given `rule_msg` is disabled. All takes precedence, then line disablers, then block disablers.
         We're checking for both message id and name.
         """
-        if not self.any_disabler:
+        if rule_msg.line not in self.disabled_lines:
             return False
-        if 'all' in self.rules:
+        if 'all' in self._rules:
             disabled = self.is_line_disabled(rule_msg.line, 'all')
             if disabled:
                 return True
-        if rule_msg.rule_id in self.rules:
+        if rule_msg.rule_id in self._rules:
             disabled = self.is_line_disabled(rule_msg.line, rule_msg.rule_id)
             if disabled:
                 return True
-        if rule_msg.name in self.rules:
+        if rule_msg.name in self._rules:
             disabled = self.is_line_disabled(rule_msg.line, rule_msg.name)
             if disabled:
                 return True
         return False
 
     def is_line_disabled(self, line, rule):
-        """ Helper method for is_rule_disabled that check if given line is in range of any disabled block"""
-        if line in self.rules[rule].lines:
+        """
+        Helper method for is_rule_disabled that check if given line is in range of any disabled block.
+        Blocks are sorted and do not overlap (new block can start only after previous one ends) so it is enough
+        to check the last block starting before or at given line.
+        """
+        disablers = self.rules[rule]
+        if line in disablers.lines:
             return True
-        return any(block[0] <= line <= block[1] for block in self.rules[rule].blocks)
+        index = bisect_right(disablers.blocks, (line, math.inf)) - 1
+        return index >= 0 and disablers.blocks[index][1] >= line
 
-    def _parse_file(self, source):
+    def _read_file(self, source):
+        """
+        Read file and only check if whole file is disabled - so it can be skipped in the scan.
+        Other disablers are parsed when needed (when there is any issue reported in this file).
+        """
         try:
             with open(source, 'r') as file:
-                lineno = -1
-                for lineno, line in enumerate(file, start=1):
-                    if '#' in line:
-                        self._parse_line(line, lineno)
-                self._end_block('all', lineno)
-                self.file_disabled = self._is_file_disabled(lineno)
-                self.any_disabler = len(self.rules) != 0
+                self.content = file.read()
         except OSError:
             raise robocop.exceptions.FileError(source)
         except UnicodeDecodeError:
-            print(f"Failed to decode {file}. Default supported encoding by Robot Framework is UTF-8. Skipping file")
+            print(f"Failed to decode {source}. Default supported encoding by Robot Framework is UTF-8. Skipping file")
             self.file_disabled = True
+            return
+        self.file_disabled = self._is_file_disabled()
 
-    def _parse_line(self, line, lineno):
-        statement, comment = line.split('#', maxsplit=1)
-        disabler = self.disabler_pattern.search(comment)
-        if not disabler:
+    def _parse_disablers(self):
+        if self.parsed:
             return
+        self.parsed = True
+        content = self.content
+        # most files do not contain disablers - search for them only from the line with first occurrence
+        first_disabler = content.find('robocop: ')
+        if first_disabler != -1:
+            lineno, position = 1, 0
+            for disabler in self.disabler_pattern.finditer(content, content.rfind('\n', 0, first_disabler) + 1):
+                lineno += content.count('\n', position, disabler.start())
+                position = disabler.start()
+                self._parse_disabler(disabler, lineno)
+        self._end_block('all', self._count_lines(content))
+        self._disabled_lines = self._get_disabled_lines()
+
+    @staticmethod
+    def _count_lines(content):
+        """ Return number of lines in the file (or -1 if file is empty) """
+        if not content:
+            return -1
+        return content.count('\n') + (not content.endswith('\n'))
+
+    def _get_disabled_lines(self):
+        lines = set()
+        for disablers in self._rules.values():
+            lines.update(disablers.lines)
+            for start, end in disablers.blocks:
+                lines.update(range(start, end + 1))
+        return lines
+
+    def _parse_disabler(self, disabler, lineno):
         if not disabler.group('rules'):
             rules = ['all']
         else:
-            rules = disabler.group('rules').split(',')
-        block = not statement
+            rules = [sys.intern(rule) for rule in disabler.group('rules').split(',')]
+        block = not disabler.group('statement')
         if disabler.group('disabler') == 'disable':
             for rule in rules:
                 if block:
@@ -92,36 +156,45 @@ class DisablersFinder:
             for rule in rules:
                 self._end_block(rule, lineno)
 
-    def _is_file_disabled(self, last_line):
+    def _is_file_disabled(self):
         """
-        If we have open block disabler at the end of file and it starts from 0.
-        It means the whole file is disabled and we can skip it in our scan.
+        If first line opens block disabler for all rules and it is not closed before the last line,
+        the whole file is disabled and we can skip it in our scan.
         """
-        if 'all' not in self.rules:
+        first_line = self.disabler_pattern.match(self.content)
+        if first_line is None or not self._is_block_disabler_for_all(first_line, 'disable'):
             return False
-        if len(self.rules['all'].blocks) != 1:
+        last_line = self._count_lines(self.content)
+        for disabler in self.disabler_pattern.finditer(self.content, first_line.end()):
+            if self._is_block_disabler_for_all(disabler, 'enable'):
+                return self.content.count('\n', 0, disabler.start()) + 1 == last_line
+        return True
+
+    @staticmethod
+    def _is_block_disabler_for_all(disabler, disabler_type):
+        if disabler.group('statement') or disabler.group('disabler') != disabler_type:
             return False
-        return self.rules['all'].blocks[0] == (1, last_line)
+        return not disabler.group('rules') or 'all' in disabler.group('rules').split(',')
 
     def _add_inline_disabler(self, rule, lineno):
-        self.rules[rule].lines.add(lineno)
+        self._rules[rule].lines.add(lineno)
 
     def _start_block(self, rule, lineno):
-        if self.rules[rule].lastblock == -1:
-            self.rules[rule].lastblock = lineno
+        if self._rules[rule].lastblock == -1:
+            self._rules[rule].lastblock = lineno
 
     def _end_block(self, rule, lineno):
         if rule == 'all':
             self._end_all_blocks(lineno)
-        if rule not in self.rules:
+        if rule not in self._rules:
             return
-        if self.rules[rule].lastblock != -1:
-            block = (self.rules[rule].lastblock, lineno)
-            self.rules[rule].lastblock = -1
-            self.rules[rule].blocks.append(block)
+        if self._rules[rule].lastblock != -1:
+            block = (self._rules[rule].lastblock, lineno)
+            self._rules[rule].lastblock = -1
+            self._rules[rule].blocks.append(block)
 
     def _end_all_blocks(self, lineno):
-        for rule in self.rules:
+        for rule in self._rules:
             if rule == 'all':
                 continue  # to avoid recursion
             self._end_block(rule, lineno)
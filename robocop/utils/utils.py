@@ -1,6 +1,9 @@
+import keyword
+from functools import lru_cache
 from pathlib import Path
 from importlib import import_module
 import importlib.util
+from string import Formatter
 from robocop.exceptions import InvalidExternalCheckerError
 
 
@@ -38,3 +41,37 @@ def modules_from_path(path, module_name=None, relative='.'):
 
 def normalize_robot_name(name):
     return name.replace(' ', '').replace('_', '').lower()
+
+
+@lru_cache()
+def compile_format(message_format):
+    """
+    Translate output message format (like ``{source}:{line}``) to f-string based function so the format
+    is parsed only once and not with every printed message. Formats using anything more than named fields
+    (positional fields, indexes, attributes, nested fields) fall back to ``str.format``.
+    """
+    fstring = ''
+    fields = []
+    try:
+        for literal, field, spec, conversion in Formatter().parse(message_format):
+            fstring += literal.replace('{', '{{').replace('}', '}}')
+            if field is None:
+                continue
+            if not field.isidentifier() or keyword.iskeyword(field) or '{' in spec:
+                return message_format.format
+            if field not in fields:
+                fields.append(field)
+            fstring += '{' + field
+            fstring += f'!{conversion}' if conversion else ''
+            fstring += f':{spec}' if spec else ''
+            fstring += '}'
+        # fields are read from kwargs so unknown field raises KeyError same as str.format
+        code = 'def format_message(**kwargs):\n'
+        if fields:
+            code += f"    {', '.join(fields)}, = {', '.join(f'kwargs[{field!r}]' for field in fields)},\n"
+        code += f'    return f{fstring!r}\n'
+        namespace = {}
+        exec(code, namespace)  # pylint: disable=exec-used
+        return namespace['format_message']
+    except (ValueError, SyntaxError):
+        return message_format.format
@@ -1,9 +1,14 @@
 """ General E2E tests to catch any general issue in robocop """
+import multiprocessing
+import pickle
+import time
 from pathlib import Path
 import pytest
-from robocop.exceptions import FileError, ArgumentFileNotFoundError, NestedArgumentFileError, ConfigGeneralError
+from robocop.exceptions import FileError, ArgumentFileNotFoundError, NestedArgumentFileError, ConfigGeneralError, \
+    InvalidRuleUsageError
 from robocop.run import Robocop
 from robocop.config import Config
+from robocop.utils import FileType
 
 
 @pytest.fixture
@@ -247,3 +252,96 @@ class TestE2E:
         robocop_instance.config = config
         with pytest.raises(SystemExit):
             robocop_instance.run()
+
+    def test_parsed_models_reused_in_scan(self, robocop_instance):
+        config = Config()
+        config.parse_opts([str(Path(Path(__file__).parent.parent, 'test_data'))])
+        robocop_instance.config = config
+        robocop_instance.recognize_file_types()
+        assert robocop_instance.models.keys() == robocop_instance.files.keys()
+        file = Path(Path(__file__).parent.parent, 'test_data', 'test.robot').absolute()
+        _, cached_model = robocop_instance.models[file]
+        assert robocop_instance.get_model(file) is cached_model
+        robocop_instance.run_checks()
+        assert not robocop_instance.models
+
+    def test_model_parsed_again_if_file_type_changed(self, robocop_instance):
+        config = Config()
+        config.parse_opts([str(Path(Path(__file__).parent.parent, 'test_data', 'test.robot'))])
+        robocop_instance.config = config
+        robocop_instance.recognize_file_types()
+        file = Path(Path(__file__).parent.parent, 'test_data', 'test.robot').absolute()
+        _, cached_model = robocop_instance.models[file]
+        robocop_instance.files[file] = FileType.RESOURCE
+        assert robocop_instance.get_model(file) is not cached_model
+
+    @pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                        reason="Files are scanned in parallel only with 'fork' start method")
+    def test_parallel_jobs_used(self, robocop_instance):
+        config = Config()
+        config.parse_opts(['--jobs', '2', str(Path(Path(__file__).parent.parent, 'test_data'))])
+        robocop_instance.config = config
+        robocop_instance.recognize_file_types()
+        assert robocop_instance.get_jobs_count() == 2
+
+    def test_run_parallel_jobs_same_output_as_serial(self, capsys):
+        outputs = []
+        for jobs in ('1', '2'):
+            robocop_instance = Robocop()
+            robocop_instance.config.parse_opts(['--jobs', jobs, str(Path(Path(__file__).parent.parent, 'test_data'))])
+            with pytest.raises(SystemExit):
+                robocop_instance.run()
+            out, _ = capsys.readouterr()
+            outputs.append(out)
+        assert outputs[0]
+        assert outputs[0] == outputs[1]
+
+    @pytest.mark.parametrize('jobs', ['1', '2'])
+    def test_fatal_error_in_rule_with_jobs(self, robocop_instance, jobs):
+        config = Config()
+        config.parse_opts([
+            '--jobs', jobs,
+            '--ext_rules', str(Path(Path(__file__).parent.parent, 'test_data', 'ext_rule_invalid_usage')),
+            '--include', '9901',
+            str(Path(Path(__file__).parent.parent, 'test_data'))
+        ])
+        robocop_instance.config = config
+        robocop_instance.checkers = []
+        robocop_instance.rules = {}
+        robocop_instance.load_checkers()
+        with pytest.raises(InvalidRuleUsageError) as err:
+            robocop_instance.run()
+        assert "Fatal error: Rule '9901' failed to prepare message description with error: %d format" \
+               in str(err.value)
+
+    @pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                        reason="Files are scanned in parallel only with 'fork' start method")
+    def test_fatal_error_with_jobs_stops_scan(self, robocop_instance, tmp_path):
+        invalid = tmp_path / 'invalid.robot'
+        invalid.write_text('*** Keywords ***\nKeyword\n    No Operation\n')
+        slow_dir = tmp_path / 'slow'
+        slow_dir.mkdir()
+        for index in range(8):
+            (slow_dir / f'slow{index}.robot').write_text('*** Test Cases ***\nTest\n    No Operation\n')
+        config = Config()
+        config.parse_opts([
+            '--jobs', '2',
+            '--ext_rules', str(Path(Path(__file__).parent.parent, 'test_data', 'ext_rule_slow_invalid_usage')),
+            '--include', '9902',
+            str(invalid),
+            str(slow_dir)
+        ])
+        robocop_instance.config = config
+        robocop_instance.checkers = []
+        robocop_instance.rules = {}
+        robocop_instance.load_checkers()
+        start = time.monotonic()
+        with pytest.raises(InvalidRuleUsageError):
+            robocop_instance.run()
+        # scanning all slow files takes at least 4 seconds with 2 processes
+        assert time.monotonic() - start < 3
+
+    def test_fatal_error_survives_pickle(self):
+        err = pickle.loads(pickle.dumps(FileError('x.robot')))
+        assert isinstance(err, FileError)
+        assert str(err) == 'File "x.robot" does not exist'
@@ -0,0 +1,16 @@
+from robocop.checkers import VisitorChecker
+from robocop.rules import RuleSeverity
+
+
+class InvalidUsageChecker(VisitorChecker):
+    """ Checker reporting message with argument not matching the description. """
+    rules = {
+        "9901": (
+            "invalid-usage",
+            "Keyword has %d calls",
+            RuleSeverity.ERROR
+        )
+    }
+
+    def visit_Keyword(self, node):  # noqa
+        self.report("invalid-usage", 'not a number', node=node)
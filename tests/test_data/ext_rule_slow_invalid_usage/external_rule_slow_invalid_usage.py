@@ -0,0 +1,25 @@
+import time
+from pathlib import Path
+
+from robocop.checkers import VisitorChecker
+from robocop.rules import RuleSeverity
+
+
+class SlowInvalidUsageChecker(VisitorChecker):
+    """ Checker failing fast on files named `invalid*` and taking its time on any other file. """
+    rules = {
+        "9902": (
+            "slow-invalid-usage",
+            "Keyword has %d calls",
+            RuleSeverity.ERROR
+        )
+    }
+
+    def visit_File(self, node):  # noqa
+        if Path(node.source).name.startswith('invalid'):
+            self.generic_visit(node)
+        else:
+            time.sleep(1)
+
+    def visit_Keyword(self, node):  # noqa
+        self.report("slow-invalid-usage", 'not a number', node=node)
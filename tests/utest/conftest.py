@@ -14,8 +14,11 @@ def robocop_instance():
 class RobocopWithoutLoadClasses(Robocop):
     def __init__(self):
         self.files = {}
+        self.models = {}
         self.checkers = []
+        self.composite_checker = None
         self.out = sys.stdout
+        self.lines_buffer = None
         self.rules = {}
         self.reports = []
         self.disabler = None
@@ -46,6 +46,20 @@ class TestArgumentValidation(unittest.TestCase):
         args = self.config.parse_opts(['--filetypes', '.robot,.resource', ''])
         self.assertSetEqual(args.filetypes, {'.resource', '.robot', '.tsv'})
 
+    def test_filetypes_lowercase(self):
+        args = self.config.parse_opts(['--filetypes', 'TXT,.Rst', ''])
+        self.assertIsInstance(args.filetypes, frozenset)
+        self.assertSetEqual(args.filetypes, {'.resource', '.robot', '.tsv', '.txt', '.rst'})
+
+    def test_jobs(self):
+        self.assertEqual(self.config.jobs, 1)
+        args = self.config.parse_opts(['--jobs', '0', ''])
+        self.assertEqual(args.jobs, 0)
+
+    def test_jobs_negative(self):
+        with self.assertRaises(SystemExit):
+            self.config.parse_opts(['--jobs', '-1', ''])
+
     def test_include_one_rule(self):
         rule_name = 'missing-keyword-doc'
         args = self.config.parse_opts(['--include', rule_name, ''])
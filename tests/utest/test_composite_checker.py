@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from robot.api import get_model
+
+from robocop.checkers import CompositeChecker
+from robocop.checkers.errors import ParsingErrorChecker
+from robocop.checkers.misc import EqualSignChecker, NestedForLoopsChecker
+from robocop.checkers.naming import KeywordNamingChecker
+from robocop.checkers.lengths import LengthChecker, LineLengthChecker
+
+
+def scan_separately(checkers, model, source):
+    issues = []
+    for checker in checkers:
+        checker.source = source
+        checker.scan_file(model)
+        issues += checker.issues
+        checker.issues.clear()
+    return sorted(issues)
+
+
+class TestCompositeChecker:
+    def test_can_compose(self):
+        assert CompositeChecker.can_compose(ParsingErrorChecker())
+        assert CompositeChecker.can_compose(EqualSignChecker())
+        assert not CompositeChecker.can_compose(KeywordNamingChecker())  # calls generic_visit
+        assert not CompositeChecker.can_compose(LengthChecker())  # overrides visit_File
+        assert not CompositeChecker.can_compose(LineLengthChecker())  # raw file checker
+
+    def test_same_issues_as_separate_scans(self):
+        source = str(Path(Path(__file__).parent.parent, 'test_data', 'test.robot'))
+        model = get_model(source)
+        expected = scan_separately([ParsingErrorChecker(), EqualSignChecker(), NestedForLoopsChecker()],
+                                   model, source)
+        checkers = [ParsingErrorChecker(), EqualSignChecker(), NestedForLoopsChecker()]
+        for checker in checkers:
+            checker.source = source
+        CompositeChecker(checkers).scan_file(model)
+        issues = sorted(issue for checker in checkers for issue in checker.issues)
+        assert expected
+        assert [(issue.rule_id, issue.line, issue.col) for issue in issues] == \
+               [(issue.rule_id, issue.line, issue.col) for issue in expected]
@@ -45,6 +45,22 @@ class TestDisablers:
         for i in range(1, 11):
             assert disabler.is_line_disabled(i, 'all')
 
+    def test_is_line_disabled_multiple_blocks(self):
+        disabler = DisablersFinder(
+            Path(Path(__file__).parent.parent, 'test_data', 'two_.disablers_blocks.robot'),
+            None
+        )
+        disabled_lines = {3, 4, 10, 11, 12, 13}
+        for i in range(1, 14):
+            assert disabler.is_line_disabled(i, 'all') == (i in disabled_lines)
+
+    def test_disabled_lines(self):
+        disabler = DisablersFinder(
+            Path(Path(__file__).parent.parent, 'test_data', 'disabled', 'disabled.robot'),
+            None
+        )
+        assert disabler.disabled_lines == {1, 2, 3, 4, 7, 11, 12}
+
     @pytest.mark.parametrize('lineno, xor', [
         (2, True),
         (7, True),
@@ -59,6 +75,29 @@ class TestDisablers:
         message.line = lineno
         assert disabler.is_rule_disabled(message) == xor
 
+    def test_disablers_parsed_on_first_use(self, message):
+        disabler = DisablersFinder(
+            Path(Path(__file__).parent.parent, 'test_data', 'disabled', 'disabled.robot'),
+            None
+        )
+        assert not disabler.file_disabled
+        assert not disabler.parsed
+        message.line = 11
+        assert disabler.is_rule_disabled(message)
+        assert disabler.parsed
+
+    def test_reset(self):
+        disabler = DisablersFinder(
+            Path(Path(__file__).parent.parent, 'test_data', 'disabled', 'disabled_whole.robot'),
+            None
+        )
+        assert disabler.file_disabled
+        assert disabler.any_disabler
+        disabler.reset(Path(Path(__file__).parent.parent, 'test_data', 'disabled', 'enabled.robot'))
+        assert not disabler.file_disabled
+        assert not disabler.any_disabler
+        assert not disabler.is_line_disabled(1, 'all')
+
     def test_enabled_file(self):
         disabler = DisablersFinder(
             Path(Path(__file__).parent.parent, 'test_data', 'disabled', 'enabled.robot'),
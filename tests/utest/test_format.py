@@ -0,0 +1,49 @@
+import pytest
+
+from robocop.utils import compile_format
+
+
+FIELDS = {
+    'source': 'file.robot',
+    'line': 5,
+    'col': 1,
+    'severity': 'W',
+    'rule_id': '0101',
+    'desc': 'Some description',
+    'msg_name': 'some-message'
+}
+
+
+class TestCompileFormat:
+    @pytest.mark.parametrize('message_format', [
+        "{source}:{line}:{col} [{severity}] {rule_id} {desc}",
+        "{source}:{line:>4}:{col:03d} [{severity!r}] {rule_id} {desc} ({msg_name})",
+        "{{escaped}} {rule_id} {{}} ' \" \\ text",
+        "no fields",
+        "{rule_id}{rule_id}",
+        ""
+    ])
+    def test_same_as_str_format(self, message_format):
+        assert compile_format(message_format)(**FIELDS) == message_format.format(**FIELDS)
+
+    @pytest.mark.parametrize('message_format', [
+        "{source.upper}",
+        "{0}",
+        "{line:>{col}}",
+        "{__import__('os')}"
+    ])
+    def test_fallback_to_str_format(self, message_format):
+        assert compile_format(message_format) == message_format.format
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError):
+            compile_format("{source")(**FIELDS)
+
+    @pytest.mark.parametrize('message_format', [
+        "{foo}",
+        "{source} {kwargs}"
+    ])
+    def test_unknown_field(self, message_format):
+        with pytest.raises(KeyError) as err:
+            compile_format(message_format)(**FIELDS)
+        assert err.value.args == (message_format.split('{')[-1][:-1],)
@@ -0,0 +1,34 @@
+import io
+
+
+class CountingStringIO(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+class TestOutput:
+    def test_buffered_lines_written_at_once(self, robocop_instance):
+        robocop_instance.out = CountingStringIO()
+        with robocop_instance.buffered_output():
+            robocop_instance.write_line('first')
+            robocop_instance.write_line('second')
+            assert robocop_instance.out.getvalue() == ''
+        assert robocop_instance.out.getvalue() == 'first\nsecond\n'
+        assert robocop_instance.out.writes == 1
+        assert robocop_instance.lines_buffer is None
+
+    def test_empty_buffer_not_written(self, robocop_instance):
+        robocop_instance.out = CountingStringIO()
+        with robocop_instance.buffered_output():
+            pass
+        assert robocop_instance.out.writes == 0
+
+    def test_write_line_outside_buffer_printed_immediately(self, robocop_instance):
+        robocop_instance.out = io.StringIO()
+        robocop_instance.write_line('report')
+        assert robocop_instance.out.getvalue() == 'report\n'
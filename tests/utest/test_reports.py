@@ -0,0 +1,68 @@
+import pytest
+
+from robocop.rules import Rule, RuleSeverity
+from robocop.reports import RulesByIdReport, RulesBySeverityReport, ReturnStatusReport
+
+
+@pytest.fixture
+def rule():
+    msg = (
+        "some-message",
+        "Some description",
+        RuleSeverity.WARNING
+    )
+    return Rule('0101', msg)
+
+
+@pytest.fixture
+def other_rule():
+    msg = (
+        "other-message-with-long-name",
+        "Some description",
+        RuleSeverity.ERROR
+    )
+    return Rule('0902', msg)
+
+
+class TestRulesByIdReport:
+    def test_no_issues(self):
+        report = RulesByIdReport()
+        assert report.get_report() == '\nIssues by IDs:\nNo issues found\n'
+
+    def test_most_common_message_first(self, rule, other_rule):
+        report = RulesByIdReport()
+        for msg_rule, count in ((rule, 1), (other_rule, 3)):
+            msg = msg_rule.prepare_message(source=None, node=None, lineno=1, col=1)
+            for _ in range(count):
+                report.add_message(msg)
+        assert report.get_report() == '\nIssues by IDs:\n' \
+                                      'E0902 (other-message-with-long-name) : 3\n' \
+                                      'W0101 (some-message)                 : 1'
+
+
+class TestRulesBySeverityReport:
+    def test_no_issues(self):
+        report = RulesBySeverityReport()
+        assert report.get_report() == 'Found 0 issues'
+
+    def test_count_by_severity(self, rule, other_rule):
+        report = RulesBySeverityReport()
+        for msg_rule, count in ((rule, 2), (other_rule, 1)):
+            msg = msg_rule.prepare_message(source=None, node=None, lineno=1, col=1)
+            for _ in range(count):
+                report.add_message(msg)
+        assert report.get_report() == '\nFound 3 issue(s): 2 WARNING(s), 1 ERROR(s).'
+
+
+class TestReturnStatusReport:
+    @pytest.mark.parametrize('quality_gate, return_status', [
+        ('E=0', 1),
+        ('E=1', 0),
+        ('E=-1', 0)
+    ])
+    def test_return_status(self, other_rule, quality_gate, return_status):
+        report = ReturnStatusReport()
+        report.configure('quality_gate', quality_gate)
+        report.add_message(other_rule.prepare_message(source=None, node=None, lineno=1, col=1))
+        report.get_report()
+        assert report.return_status == return_status